@@ -0,0 +1,64 @@
+import pandas as pd
+import altair as alt
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import mean_squared_error, r2_score
+import numpy as np
+
+file_options = (
+    "RNAseq_mouse_invitro_cold_one_vs_zero.csv",
+    "RNAseq_mouse_invitro_cold_twelve_vs_one.csv",
+    "RNAseq_mouse_invitro_cold_twelve_vs_zero.csv",
+    "RNAseq_mouse_invivo_cold_22_vs_29.csv"
+)
+
+
+def load_data(path, file_option):
+    return pd.read_csv(f"{path}/{file_option}").dropna()
+
+
+def significance_chart(df):
+    # Altair Plotting for significance
+    return alt.Chart(df).mark_point().encode(
+        x=alt.X('baseMean:Q', scale=alt.Scale(type='log'), title='log2(Base Mean)'),
+        y='log2FoldChange:Q',
+        color=alt.condition(
+            alt.datum.padj < 0.05,
+            alt.value('blue'),  # Significant points in blue
+            alt.value('red')    # Non-significant points in red
+        ),
+        tooltip=['Symbol:N', 'baseMean:Q', 'log2FoldChange:Q']
+    ).interactive()
+
+
+def merge_datasets(df1, df2):
+    # Merge datasets on 'Symbol' for comparison
+    return pd.merge(df1[['Symbol', 'log2FoldChange']], df2[['Symbol', 'log2FoldChange']], on='Symbol', suffixes=('_1', '_2'))
+
+
+def linear_regression(merged_df):
+    X = merged_df[['log2FoldChange_1']]
+    Y = merged_df['log2FoldChange_2']
+
+    model = LinearRegression().fit(X, Y)
+    Y_pred = model.predict(X)
+
+    # Calculating metrics
+    mse = mean_squared_error(Y, Y_pred)
+    r2 = r2_score(Y, Y_pred)
+    r = np.sqrt(r2)
+    return mse, r2, r
+
+
+def regression_chart(merged_df):
+    # Scatter plot with regression line using Altair
+    scatter = alt.Chart(merged_df).mark_point(color='blue').encode(
+        x='log2FoldChange_1:Q',
+        y='log2FoldChange_2:Q',
+        tooltip=['Symbol:N', 'log2FoldChange_1:Q', 'log2FoldChange_2:Q']
+    )
+
+    regression_line = scatter.transform_regression(
+        'log2FoldChange_1', 'log2FoldChange_2', method="linear"
+    ).mark_line(color='red')
+
+    return scatter + regression_line
@@ -1,11 +1,7 @@
 # Import necessary libraries
 import streamlit as st
-import pandas as pd
-import altair as alt
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_squared_error, r2_score
-import numpy as np
 import os
+from charts import file_options, load_data, significance_chart, merge_datasets, linear_regression, regression_chart
 
 
 # Set page title
@@ -94,17 +90,12 @@ with tab2:
     """)
 
     # File selection
-    file_option = st.selectbox("Select a CSV file", (
-        "RNAseq_mouse_invitro_cold_one_vs_zero.csv",
-        "RNAseq_mouse_invitro_cold_twelve_vs_one.csv",
-        "RNAseq_mouse_invitro_cold_twelve_vs_zero.csv",
-        "RNAseq_mouse_invivo_cold_22_vs_29.csv"
-    ))
+    file_option = st.selectbox("Select a CSV file", file_options)
     
     path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 
     # Load data
-    df = pd.read_csv(f"{path}/{file_option}").dropna()
+    df = load_data(path, file_option)
 
     # Search bar for gene symbol
     search_query = st.text_input("Search for a Gene Symbol")
@@ -132,16 +123,7 @@ with tab2:
     """)
 
     # Altair Plotting for significance
-    points = alt.Chart(df).mark_point().encode(
-        x=alt.X('baseMean:Q', scale=alt.Scale(type='log'), title='log2(Base Mean)'),
-        y='log2FoldChange:Q',
-        color=alt.condition(
-            alt.datum.padj < 0.05, 
-            alt.value('blue'),  # Significant points in blue
-            alt.value('red')    # Non-significant points in red
-        ),
-        tooltip=['Symbol:N', 'baseMean:Q', 'log2FoldChange:Q'] 
-    ).interactive()
+    points = significance_chart(df)
 
     st.altair_chart(points, use_container_width=True)
 
@@ -160,58 +142,31 @@ with tab3:
     """)
 
     # File selection for comparison
-    file_option1 = st.selectbox("Select the first CSV file for comparison", (
-        "RNAseq_mouse_invitro_cold_one_vs_zero.csv",
-        "RNAseq_mouse_invitro_cold_twelve_vs_one.csv",
-        "RNAseq_mouse_invitro_cold_twelve_vs_zero.csv",
-        "RNAseq_mouse_invivo_cold_22_vs_29.csv"
-    ), key='file1')
-
-    file_option2 = st.selectbox("Select the second CSV file for comparison", (
-        "RNAseq_mouse_invitro_cold_one_vs_zero.csv",
-        "RNAseq_mouse_invitro_cold_twelve_vs_one.csv",
-        "RNAseq_mouse_invitro_cold_twelve_vs_zero.csv",
-        "RNAseq_mouse_invivo_cold_22_vs_29.csv"
-    ), key='file2')
+    file_option1 = st.selectbox("Select the first CSV file for comparison", file_options, key='file1')
+
+    file_option2 = st.selectbox("Select the second CSV file for comparison", file_options, key='file2')
 
     path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 
     # Load data for comparison
-    df1 = pd.read_csv(f"{path}/{file_option1}").dropna()
-    df2 = pd.read_csv(f"{path}/{file_option2}").dropna()
+    df1 = load_data(path, file_option1)
+    df2 = load_data(path, file_option2)
 
     # Merge datasets on 'Symbol' for comparison
-    merged_df = pd.merge(df1[['Symbol', 'log2FoldChange']], df2[['Symbol', 'log2FoldChange']], on='Symbol', suffixes=('_1', '_2'))
+    merged_df = merge_datasets(df1, df2)
 
     # Linear Regression and Plot
     if st.button("Run Linear Regression"):
-        X = merged_df[['log2FoldChange_1']]
-        Y = merged_df['log2FoldChange_2']
-
-        model = LinearRegression().fit(X, Y)
-        Y_pred = model.predict(X)
-
-        # Calculating metrics
-        mse = mean_squared_error(Y, Y_pred)
-        r2 = r2_score(Y, Y_pred)
-        r = np.sqrt(r2)
+        mse, r2, r = linear_regression(merged_df)
 
         st.write(f"Mean Squared Error: {mse}")
         st.write(f"R-Squared: {r2}")
         st.write(f"R: {r}")
 
         # Scatter plot with regression line using Altair
-        scatter = alt.Chart(merged_df).mark_point(color='blue').encode(
-            x='log2FoldChange_1:Q',
-            y='log2FoldChange_2:Q',
-        tooltip=['Symbol:N', 'log2FoldChange_1:Q', 'log2FoldChange_2:Q'] 
-        )
-
-        regression_line = scatter.transform_regression(
-            'log2FoldChange_1', 'log2FoldChange_2', method="linear"
-        ).mark_line(color='red')
+        chart = regression_chart(merged_df)
 
-        st.altair_chart(scatter + regression_line, use_container_width=True)
+        st.altair_chart(chart, use_container_width=True)
 
     st.markdown("""
         The linear regression analysis conducted on various pairings of RNA-seq data from in vitro and in vivo experiments has yielded insights into the correlations between different experimental conditions. The key metrics used in this analysis were Mean Squared Error (MSE), R-Squared, and the correlation coefficient (R).
@@ -0,0 +1,121 @@
+"""Render every chart in main.py to a static report without a Streamlit server.
+
+Usage: python report.py [--out report] [--workers N] [--png] [--force]
+
+Each dataset and each pair of datasets is written as Vega-Lite JSON (and
+optionally PNG) next to the table it was drawn from. Comparisons also get the
+regression metrics. Outputs whose inputs have not changed since the last run
+are skipped.
+"""
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+
+from charts import file_options, load_data, significance_chart, merge_datasets, linear_regression, regression_chart
+
+root = os.path.dirname(os.path.abspath(__file__))
+path = os.path.join(root, "data")
+
+
+def list_tasks():
+    tasks = [('significance', (file_option,)) for file_option in file_options]
+    tasks += [('comparison', (file_option1, file_option2))
+              for file_option1, file_option2 in product(file_options, file_options)]
+    return tasks
+
+
+def task_name(kind, files):
+    return '_'.join([kind] + [os.path.splitext(file)[0] for file in files])
+
+
+def file_digest(file):
+    digest = hashlib.sha256()
+    with open(file, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def task_hash(digests, name, files):
+    # A chart depends on the datasets it reads and on the code that plots them
+    inputs = [digests[file] for file in files] + [digests["charts.py"], digests["report.py"]]
+    return hashlib.sha256(':'.join([name] + inputs).encode()).hexdigest()
+
+
+def output_files(out_dir, kind, name, png):
+    files = [os.path.join(out_dir, f"{name}.vl.json"), os.path.join(out_dir, f"{name}.csv")]
+    if kind == 'comparison':
+        files.append(os.path.join(out_dir, f"{name}.metrics.json"))
+    if png:
+        files.append(os.path.join(out_dir, f"{name}.png"))
+    return files
+
+
+def render(kind, files, out_dir, png):
+    name = task_name(kind, files)
+    if kind == 'significance':
+        table = load_data(path, files[0])
+        chart = significance_chart(table)
+    else:
+        table = merge_datasets(load_data(path, files[0]), load_data(path, files[1]))
+        chart = regression_chart(table)
+        mse, r2, r = linear_regression(table)
+        with open(os.path.join(out_dir, f"{name}.metrics.json"), 'w') as f:
+            json.dump({'mse': mse, 'r2': r2, 'r': r}, f, indent=2)
+
+    table.to_csv(os.path.join(out_dir, f"{name}.csv"), index=False)
+    chart.save(os.path.join(out_dir, f"{name}.vl.json"))
+    if png:
+        chart.save(os.path.join(out_dir, f"{name}.png"))
+    return name
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every chart combination of the Final app.")
+    parser.add_argument('--out', default=os.path.join(root, "report"), help="output directory")
+    parser.add_argument('--workers', type=int, default=None, help="number of worker processes")
+    parser.add_argument('--png', action='store_true', help="also write PNG images (needs vl-convert-python)")
+    parser.add_argument('--force', action='store_true', help="re-render outputs even if inputs are unchanged")
+    options = parser.parse_args()
+
+    os.makedirs(options.out, exist_ok=True)
+    manifest_path = os.path.join(options.out, "manifest.json")
+    manifest = {}
+    if os.path.exists(manifest_path) and not options.force:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    digests = {file_option: file_digest(f"{path}/{file_option}") for file_option in file_options}
+    for name in ("charts.py", "report.py"):
+        digests[name] = file_digest(os.path.join(root, name))
+
+    tasks = list_tasks()
+    pending = []
+    for kind, files in tasks:
+        name = task_name(kind, files)
+        fresh = manifest.get(name) == task_hash(digests, name, files)
+        if fresh and all(os.path.exists(file) for file in output_files(options.out, kind, name, options.png)):
+            continue
+        pending.append((kind, files))
+
+    print(f"{len(pending)} of {len(tasks)} charts to render")
+    if not pending:
+        return
+
+    with ProcessPoolExecutor(max_workers=options.workers) as executor:
+        futures = {executor.submit(render, kind, files, options.out, options.png): files for kind, files in pending}
+        try:
+            for future in as_completed(futures):
+                name = future.result()
+                manifest[name] = task_hash(digests, name, futures[future])
+        finally:
+            # Keep what finished so an interrupted run can resume
+            with open(manifest_path, 'w') as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+import altair as alt
+
+# Create a dictionary to map column names to more descriptive strings
+column_map = {
+    'RaceEthn5': 'Race/Ethnicity',
+    'BirthGender': 'Birth Gender',
+    'EducA': 'Education Level',
+    'RUC2013': 'Rural-Urban Code',
+    'GeneralHealth': 'General Health',
+    'UseInternet': 'Internet Usage',
+    'HealthInsurance': 'Health Insurance',
+    'age_cat': 'Age Category'
+}
+
+x_variable_map = {
+    'SpentEnoughTime': 'spend enough time with you?',
+    'InvolvedDecisions': 'involve you in decisions about your health care as much as you wanted?',
+    'ChanceAskQuestions': 'give you the chance to ask all the health- related questions you had?',
+    'FeelingsAddressed': 'give the attention you needed to your feelings and emotions?',
+    'UnderstoodNextSteps': 'make sure you understood the things you needed to do to take care of your health?',
+    'HelpUncertainty': 'help you deal with feelings of uncertainty about your health or health care?',
+    'ExplainedClearly': 'explain things in a way you could understand?'
+}
+
+survey_years = [2017, 2019, 2020, 2022]
+
+spent_enough_time_order = ['Never', 'Sometimes', 'Usually', 'Always']
+
+# Define your custom orders here
+access_online_record_cat_2_order = ["None", "1 to 2 times", "3 to 5 times", "6 to 9 times", "10 or more times"]
+
+
+# Plot 1: proportion of portal access over time by a demographic variable
+def portal_access_table(combined_df, group_variable):
+    # Calculate proportions for the selected variable
+    grouped_df = combined_df.groupby(['survey_year', group_variable])
+    yes_grouped = grouped_df['AccessOnlineRecord_cat'].apply(lambda x: (x == 'Yes').mean()).reset_index()
+    return yes_grouped.rename(columns={'AccessOnlineRecord_cat': 'proportion_yes'})
+
+
+def portal_access_chart(yes_grouped, group_variable):
+    return alt.Chart(yes_grouped).mark_line().encode(
+        x='survey_year:O',  # Treat survey_year as ordinal data
+        y=alt.Y('proportion_yes:Q', axis=alt.Axis(format='.0%'), title='Proportion saying Yes'),
+        color=f'{group_variable}:N',
+        tooltip=[
+            alt.Tooltip('survey_year:O', title='Year'),
+            alt.Tooltip(f'{group_variable}:N', title=group_variable),
+            alt.Tooltip('proportion_yes:Q', title='Proportion saying Yes', format='.0%')
+        ]
+    ).properties(
+        title=f"Proportion of 'Yes' responses to AccessOnlineRecord_cat over time by {group_variable}",
+        width=800
+    )
+
+
+# Plot 2: portal access frequency by a communication question for one year
+def access_by_communication_table(combined_df, x_variable, year):
+    # Subset the dataframe for the specific year
+    year_subset = combined_df[combined_df['survey_year'] == year]
+
+    # Calculate proportions
+    grouped_df = year_subset.groupby([x_variable, 'AccessOnlineRecord_cat_2']).size().reset_index(name='counts')
+    total = year_subset.groupby(x_variable).size().reset_index(name='total')
+    grouped_df = grouped_df.merge(total, on=x_variable)
+    grouped_df['proportion'] = grouped_df['counts'] / grouped_df['total']
+    return grouped_df
+
+
+def access_by_communication_chart(grouped_df, x_variable, year):
+    # Base chart
+    base = alt.Chart(grouped_df).mark_bar().encode(
+        x=alt.X('AccessOnlineRecord_cat_2:N', sort=access_online_record_cat_2_order, title=None),
+        y=alt.Y('proportion:Q', axis=alt.Axis(format='%')),
+        color='AccessOnlineRecord_cat_2:N',
+        tooltip=[x_variable, 'AccessOnlineRecord_cat_2', 'proportion']
+    ).properties(
+        width=150
+    )
+
+    # Facet the chart
+    return base.facet(
+        column=alt.Column(f'{x_variable}:N', sort=spent_enough_time_order, header=alt.Header(labelOrient="top", title="How many times did you access your online medical record or patient portal in the last 12 months?", titleOrient="bottom")),
+        spacing=15
+    ).resolve_scale(
+        x='shared'
+    ).properties(
+        title=f"Proportion of those who accessed online portals by '{x_variable}' for the year {year}"
+    )
+
+
+# Plot 3: communication responses by a demographic variable for one year
+def communication_by_group_table(combined_df, group_variable, x_variable, year):
+    year_subset = combined_df[combined_df['survey_year'] == year]
+    grouped_df = year_subset.groupby([group_variable, x_variable]).size().reset_index(name='counts')
+    total = year_subset.groupby(group_variable).size().reset_index(name='total')
+    grouped_df = grouped_df.merge(total, on=group_variable)
+    grouped_df['proportion'] = grouped_df['counts'] / grouped_df['total']
+    return grouped_df
+
+
+def communication_by_group_chart(grouped_df, group_variable, x_variable, year):
+    # Base chart for the new plot
+    base = alt.Chart(grouped_df).mark_bar().encode(
+        x=alt.X(f'{x_variable}:N', sort=spent_enough_time_order, title=None),  # Remove title here
+        y=alt.Y('proportion:Q', axis=alt.Axis(format='%')),
+        color=f'{x_variable}:N',
+        tooltip=[group_variable, x_variable, 'proportion']
+    ).properties(
+        width=100
+    )
+
+    # Facet the new chart
+    return base.facet(
+        column=alt.Column(f'{group_variable}:N', sort=spent_enough_time_order, header=alt.Header(labelOrient="top", title=f"{x_variable}", titleOrient="bottom")),  # Adjust the title here
+        spacing=15
+    ).resolve_scale(
+        x='shared'
+    ).properties(
+        title=f"Proportion of each option in '{x_variable}' by '{group_variable}' for the year {year}"
+    )
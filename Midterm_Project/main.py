@@ -1,7 +1,11 @@
 import streamlit as st
-import pandas as pd
-import altair as alt
 from clean_data import combined_df_cleaned as combined_df
+from charts import (
+    column_map, x_variable_map, survey_years,
+    portal_access_table, portal_access_chart,
+    access_by_communication_table, access_by_communication_chart,
+    communication_by_group_table, communication_by_group_chart
+)
 
 st.title("Exploring the Relationship between Patient Portal Access and Patient Centered communication")
 
@@ -37,18 +41,6 @@ The plots revealed two primary observations. Firstly, there has been a general i
 When assessing portal access variations among different demographic categories, it's evident that Black and Hispanic individuals, those with lower educational levels, residents of non-metro areas, individuals in fair or poor health, those without internet access, the uninsured, and older populations generally accessed portals less frequently across all timeframes. This trend is concerning, as these groups are often already marginalized in many healthcare contexts. If these individuals remain less engaged with patient portals, their ability to benefit from healthcare resources might be limited, potentially exacerbating existing healthcare disparities.
 """)
 
-# Create a dictionary to map column names to more descriptive strings
-column_map = {
-    'RaceEthn5': 'Race/Ethnicity',
-    'BirthGender': 'Birth Gender',
-    'EducA': 'Education Level',
-    'RUC2013': 'Rural-Urban Code',
-    'GeneralHealth': 'General Health',
-    'UseInternet': 'Internet Usage',
-    'HealthInsurance': 'Health Insurance',
-    'age_cat': 'Age Category'
-}
-
 # Use the mapped strings in the dropdown
 selected_label = st.selectbox(
     "Choose the variable to group by:",
@@ -59,41 +51,14 @@ selected_label = st.selectbox(
 group_variable = [col for col, label in column_map.items() if label == selected_label][0]
 
 # Calculate proportions for the selected variable
-grouped_df = combined_df.groupby(['survey_year', group_variable])
-yes_grouped = grouped_df['AccessOnlineRecord_cat'].apply(lambda x: (x == 'Yes').mean()).reset_index()
-yes_grouped = yes_grouped.rename(columns={'AccessOnlineRecord_cat': 'proportion_yes'})
+yes_grouped = portal_access_table(combined_df, group_variable)
 
 # Plot
-chart = alt.Chart(yes_grouped).mark_line().encode(
-    x='survey_year:O',  # Treat survey_year as ordinal data
-    y=alt.Y('proportion_yes:Q', axis=alt.Axis(format='.0%'), title='Proportion saying Yes'),
-    color=f'{group_variable}:N',
-    tooltip=[
-        alt.Tooltip('survey_year:O', title='Year'),
-        alt.Tooltip(f'{group_variable}:N', title=group_variable),
-        alt.Tooltip('proportion_yes:Q', title='Proportion saying Yes', format='.0%')
-    ]
-).properties(
-    title=f"Proportion of 'Yes' responses to AccessOnlineRecord_cat over time by {group_variable}",
-    width=800
-)
+chart = portal_access_chart(yes_grouped, group_variable)
 
 st.altair_chart(chart)
 
 
-x_variable_map = {
-    'SpentEnoughTime': 'spend enough time with you?',
-    'InvolvedDecisions': 'involve you in decisions about your health care as much as you wanted?',
-    'ChanceAskQuestions': 'give you the chance to ask all the health- related questions you had?',
-    'FeelingsAddressed': 'give the attention you needed to your feelings and emotions?',
-    'UnderstoodNextSteps': 'make sure you understood the things you needed to do to take care of your health?',
-    'HelpUncertainty': 'help you deal with feelings of uncertainty about your health or health care?',
-    'ExplainedClearly': 'explain things in a way you could understand?'
-}
-
-spent_enough_time_order = ['Never', 'Sometimes', 'Usually', 'Always']
-
-
 st.markdown("""
 ### Part 2: Relationship between access of patient portals and patient provider communication
 Previous research suggests a potential correlation between effective patient-doctor communication and increased utilization of patient portals. Consequently, the subsequent phase of this project aims to explore the relationship between patient portal usage and patient-provider communication.
@@ -124,39 +89,12 @@ x_variable = [col for col, question in x_variable_map.items() if question == sel
 
 
 # Dropdown to select the year
-selected_year = st.selectbox("Choose the year for plot 3:", [2017, 2019, 2020, 2022])
-
-# Subset the dataframe for the specific year
-year_subset = combined_df[combined_df['survey_year'] == selected_year]
+selected_year = st.selectbox("Choose the year for plot 3:", survey_years)
 
 # Calculate proportions
-grouped_df = year_subset.groupby([x_variable, 'AccessOnlineRecord_cat_2']).size().reset_index(name='counts')
-total = year_subset.groupby(x_variable).size().reset_index(name='total')
-grouped_df = grouped_df.merge(total, on=x_variable)
-grouped_df['proportion'] = grouped_df['counts'] / grouped_df['total']
-
-# Define your custom orders here
-access_online_record_cat_2_order = ["None", "1 to 2 times", "3 to 5 times", "6 to 9 times", "10 or more times"]
-
-# Base chart
-base = alt.Chart(grouped_df).mark_bar().encode(
-    x=alt.X('AccessOnlineRecord_cat_2:N', sort=access_online_record_cat_2_order, title=None),
-    y=alt.Y('proportion:Q', axis=alt.Axis(format='%')),
-    color='AccessOnlineRecord_cat_2:N',
-    tooltip=[x_variable, 'AccessOnlineRecord_cat_2', 'proportion']
-).properties(
-    width=150
-)
+grouped_df = access_by_communication_table(combined_df, x_variable, selected_year)
 
-# Facet the chart
-chart = base.facet(
-    column=alt.Column(f'{x_variable}:N', sort=spent_enough_time_order, header=alt.Header(labelOrient="top", title="How many times did you access your online medical record or patient portal in the last 12 months?", titleOrient="bottom")),
-    spacing=15
-).resolve_scale(
-    x='shared'
-).properties(
-    title=f"Proportion of those who accessed online portals by '{x_variable}' for the year {selected_year}"
-)
+chart = access_by_communication_chart(grouped_df, x_variable, selected_year)
 
 st.altair_chart(chart)
 
@@ -173,7 +111,7 @@ selected_group = st.selectbox(
 )
 
 # Dropdown to select the year
-selected_year_2 = st.selectbox("Choose the year for final plot:", [2017, 2019, 2020, 2022])
+selected_year_2 = st.selectbox("Choose the year for final plot:", survey_years)
 
 
 group_variable_new = [col for col, label in column_map.items() if label == selected_group][0]
@@ -186,31 +124,9 @@ selected_x_question_new = st.selectbox(
 x_variable_new = [col for col, question in x_variable_map.items() if question == selected_x_question_new][0]
 
 # Calculate data for the new plot
-year_subset = combined_df[combined_df['survey_year'] == selected_year_2]
-grouped_df_new = year_subset.groupby([group_variable_new, x_variable_new]).size().reset_index(name='counts')
-total_new = year_subset.groupby(group_variable_new).size().reset_index(name='total')
-grouped_df_new = grouped_df_new.merge(total_new, on=group_variable_new)
-grouped_df_new['proportion'] = grouped_df_new['counts'] / grouped_df_new['total']
-
-# Base chart for the new plot
-base_new = alt.Chart(grouped_df_new).mark_bar().encode(
-    x=alt.X(f'{x_variable_new}:N', sort=spent_enough_time_order, title=None),  # Remove title here
-    y=alt.Y('proportion:Q', axis=alt.Axis(format='%')),
-    color=f'{x_variable_new}:N',
-    tooltip=[group_variable_new, x_variable_new, 'proportion']
-).properties(
-    width=100
-)
+grouped_df_new = communication_by_group_table(combined_df, group_variable_new, x_variable_new, selected_year_2)
 
-# Facet the new chart
-chart_new = base_new.facet(
-    column=alt.Column(f'{group_variable_new}:N', sort=spent_enough_time_order, header=alt.Header(labelOrient="top", title=f"{x_variable_new}", titleOrient="bottom")),  # Adjust the title here
-    spacing=15
-).resolve_scale(
-    x='shared'
-).properties(
-    title=f"Proportion of each option in '{x_variable_new}' by '{group_variable_new}' for the year {selected_year_2}"
-)
+chart_new = communication_by_group_chart(grouped_df_new, group_variable_new, x_variable_new, selected_year_2)
 
 st.altair_chart(chart_new)
 
@@ -0,0 +1,138 @@
+"""Render every chart in main.py to a static report without a Streamlit server.
+
+Usage: python report.py [--out report] [--workers N] [--png] [--force]
+
+Each selectbox combination is written as Vega-Lite JSON (and optionally PNG)
+next to the aggregated table it was drawn from. Outputs whose inputs have not
+changed since the last run are skipped.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+
+from charts import (
+    column_map, x_variable_map, survey_years,
+    portal_access_table, portal_access_chart,
+    access_by_communication_table, access_by_communication_chart,
+    communication_by_group_table, communication_by_group_chart
+)
+
+root = os.path.dirname(os.path.abspath(__file__))
+path = os.path.join(root, "data")
+
+# Set in each worker process by init_worker
+combined_df = None
+
+
+def list_tasks():
+    tasks = [('portal_access', (group_variable,)) for group_variable in column_map]
+    tasks += [('access_by_communication', (x_variable, year))
+              for x_variable, year in product(x_variable_map, survey_years)]
+    tasks += [('communication_by_group', (group_variable, x_variable, year))
+              for group_variable, x_variable, year in product(column_map, x_variable_map, survey_years)]
+    return tasks
+
+
+def task_name(kind, args):
+    return '_'.join([kind] + [str(arg) for arg in args])
+
+
+def input_digest():
+    # Every chart depends on the raw survey files and on the code that cleans and plots them
+    files = sorted(glob.glob(f"{path}/*.sas7bdat"))
+    files += [os.path.join(root, name) for name in ("clean_data.py", "charts.py", "report.py")]
+    digest = hashlib.sha256()
+    for file in files:
+        digest.update(os.path.basename(file).encode())
+        with open(file, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def task_hash(digest, name):
+    return hashlib.sha256(f"{digest}:{name}".encode()).hexdigest()
+
+
+def output_files(out_dir, name, png):
+    files = [os.path.join(out_dir, f"{name}.vl.json"), os.path.join(out_dir, f"{name}.csv")]
+    if png:
+        files.append(os.path.join(out_dir, f"{name}.png"))
+    return files
+
+
+def init_worker(df):
+    global combined_df
+    combined_df = df
+
+
+def render(kind, args, out_dir, png):
+    if kind == 'portal_access':
+        table = portal_access_table(combined_df, *args)
+        chart = portal_access_chart(table, *args)
+    elif kind == 'access_by_communication':
+        table = access_by_communication_table(combined_df, *args)
+        chart = access_by_communication_chart(table, *args)
+    else:
+        table = communication_by_group_table(combined_df, *args)
+        chart = communication_by_group_chart(table, *args)
+
+    name = task_name(kind, args)
+    table.to_csv(os.path.join(out_dir, f"{name}.csv"), index=False)
+    chart.save(os.path.join(out_dir, f"{name}.vl.json"))
+    if png:
+        chart.save(os.path.join(out_dir, f"{name}.png"))
+    return name
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every chart combination of the Midterm app.")
+    parser.add_argument('--out', default=os.path.join(root, "report"), help="output directory")
+    parser.add_argument('--workers', type=int, default=None, help="number of worker processes")
+    parser.add_argument('--png', action='store_true', help="also write PNG images (needs vl-convert-python)")
+    parser.add_argument('--force', action='store_true', help="re-render outputs even if inputs are unchanged")
+    options = parser.parse_args()
+
+    os.makedirs(options.out, exist_ok=True)
+    manifest_path = os.path.join(options.out, "manifest.json")
+    manifest = {}
+    if os.path.exists(manifest_path) and not options.force:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    digest = input_digest()
+    tasks = list_tasks()
+    pending = []
+    for kind, args in tasks:
+        name = task_name(kind, args)
+        fresh = manifest.get(name) == task_hash(digest, name)
+        if fresh and all(os.path.exists(file) for file in output_files(options.out, name, options.png)):
+            continue
+        pending.append((kind, args))
+
+    print(f"{len(pending)} of {len(tasks)} charts to render")
+    if not pending:
+        return
+
+    # Only load the survey data when something actually needs rendering
+    from clean_data import combined_df_cleaned
+
+    with ProcessPoolExecutor(max_workers=options.workers, initializer=init_worker,
+                             initargs=(combined_df_cleaned,)) as executor:
+        futures = [executor.submit(render, kind, args, options.out, options.png) for kind, args in pending]
+        try:
+            for future in as_completed(futures):
+                name = future.result()
+                manifest[name] = task_hash(digest, name)
+        finally:
+            # Keep what finished so an interrupted run can resume
+            with open(manifest_path, 'w') as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()